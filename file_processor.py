@@ -1,13 +1,35 @@
 import argparse
+import csv
 import json
 import os
-from functools import reduce
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from typing import Any
+from typing import Callable
 from typing import Dict
-
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import numpy as np
 import pandas as pd
 
-problems: Dict[str, Any] = {}
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pv
+except ImportError:
+    pa = None
+    pv = None
 
 none: str = "none"
 unique: str = "unique"
@@ -16,29 +38,111 @@ int_type: str = "int"
 string_type: str = "string"
 date_type: str = "date"
 country_code_type: str = "country_code"
+date_format: str = '%Y-%m-%d %H:%M:%S'
+
+# Files larger than this are read and validated in chunks of rows
+large_file_size: int = 1024 ** 3
+chunk_size: int = 1_000_000
+index_column: str = "INDEX"
+
+# Result columns of each validation, formatted with the field name
+none_column: str = "NONE_{}_VALUE"
+repeat_column: str = "Repeat_{}"
+repeat_indexes_column: str = "Repeat_{}_indexes"
+int_column: str = "NULL_{}_INT"
+string_column: str = "NULL_{}_STRING"
+date_column: str = "INVALID_{}_FORMAT"
+country_code_column: str = "NOT_IN_{}_LIST"
+value_columns: frozenset = frozenset([repeat_column, repeat_indexes_column])
+
+# uint8 tags used to classify the values of object columns
+string_tag: int = 1
+value_tags: Dict[Any, int] = {str: string_tag, np.str_: string_tag, int: 2, float: 3}
+other_tag: int = 4
+
+country_codes: frozenset = frozenset(["AR", "BR", "CL", "CO", "CR", "CU", "DO", "EC", "SV", "GT", "HT", "HN", "JM",
+                                      "MX", "NI", "PA", "PY", "PE", "PR", "UY", "VE"])
 
 
 class ColumnNotFoundError(Exception):
     pass
 
 
-def extract_data(file: str, delimiter: str) -> pd.DataFrame:
+@dataclass
+class ColumnCtx:
+    """
+    Data of a field computed once and shared by all of its validators.
+
+    Attributes:
+    field (str): The field name.
+    column (Series): The values of the field.
+    null_mask (ndarray): Boolean mask of the null values.
+    notnull_mask (ndarray): Boolean mask of the non-null values.
+    index (Index): The index of the DataFrame.
+    """
+    field: str
+    column: pd.Series
+    null_mask: np.ndarray
+    notnull_mask: np.ndarray
+    index: pd.Index
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, field: str) -> "ColumnCtx":
+        """
+        Builds the context of a field of a DataFrame.
+
+        Parameters:
+        df (DataFrame): The DataFrame to validate.
+        field (str): The field name.
+
+        Returns:
+        ColumnCtx: The context of the field.
+
+        Raises:
+        KeyError: If the DataFrame does not have the field.
+        """
+        column = df[field]
+        null_mask = column.isna().to_numpy()
+        return cls(field, column, null_mask, ~null_mask, df.index)
+
+
+def extract_data(file: str, delimiter: str, data_config: dict) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """
-    Extracts data from a CSV file and sets custom indices.
+    Extracts the configured fields from a CSV file and sets custom indices.
+
+    Only the columns listed in the "data_valid" section of the configuration are read, and date fields are parsed
+    while reading. The C engine is always used, so the types of the other columns do not depend on pyarrow being
+    installed (its engine also turns timestamp-like text into datetimes). Files larger than large_file_size are not
+    loaded at once, an iterator of chunks of chunk_size rows is returned instead, read with the types inferred over
+    the whole file so that they do not depend on the chunk boundaries.
 
     Parameters:
     file (str): The path to the CSV file.
     delimiter (str): The delimiter used in the CSV file.
+    data_config (dict): The JSON configuration containing the validation rules.
 
     Returns:
-    DataFrame: The DataFrame containing the extracted data.
+    DataFrame or Iterator[DataFrame]: The extracted data, or its chunks for large files.
 
     Raises:
     FileNotFoundError: If the file does not exist.
     pd.errors.ParserError: If there is an error reading the file.
     """
+    fields = data_config["data_valid"]
     try:
-        df = pd.read_csv(file, delimiter=delimiter)
+        # Missing fields are left out here and reported by the validators
+        header = pd.read_csv(file, delimiter=delimiter, nrows=0).columns
+        usecols = [field for field in fields if field in header]
+        parse_dates = [field for field in usecols if fields[field].get(type) == date_type]
+
+        if os.path.getsize(file) > large_file_size:
+            dtypes = infer_dtypes(file, delimiter, [field for field in usecols if field not in parse_dates])
+            reader = pd.read_csv(file, delimiter=delimiter, usecols=usecols, dtype=dtypes, parse_dates=parse_dates,
+                                 date_format=date_format, chunksize=chunk_size)
+            return read_chunks(file, reader)
+
+        df = pd.read_csv(file, delimiter=delimiter, usecols=usecols, parse_dates=parse_dates,
+                         date_format=date_format)
         df.index = df.index + 2
         return df
     except FileNotFoundError:
@@ -47,10 +151,71 @@ def extract_data(file: str, delimiter: str) -> pd.DataFrame:
         raise pd.errors.ParserError(f"There was an error reading the file {file}.")
 
 
+def infer_dtypes(file: str, delimiter: str, fields: List[str]) -> Dict[str, Any]:
+    """
+    Infers the types of columns of a CSV file over the whole file, reading it in chunks of chunk_size rows.
+
+    A column keeps the type of its chunks when they all agree, and gets the widest type when they are all numeric.
+    Otherwise some chunk has text, so the whole column is read as text, as read_csv does with the whole file.
+
+    Parameters:
+    file (str): The path to the CSV file.
+    delimiter (str): The delimiter used in the CSV file.
+    fields (list of str): The columns to infer.
+
+    Returns:
+    dict: The type of each column with rows.
+    """
+    if not fields:
+        return {}
+
+    seen: Dict[str, set] = {field: set() for field in fields}
+    for chunk in pd.read_csv(file, delimiter=delimiter, usecols=fields, chunksize=chunk_size):
+        for field, dtype in chunk.dtypes.items():
+            seen[field].add(dtype)
+
+    dtypes: Dict[str, Any] = {}
+    for field, field_dtypes in seen.items():
+        if not field_dtypes:
+            continue
+        if len(field_dtypes) == 1:
+            dtypes[field] = field_dtypes.pop()
+        elif all(pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+                 for dtype in field_dtypes):
+            dtypes[field] = np.result_type(*field_dtypes)
+        else:
+            dtypes[field] = str
+    return dtypes
+
+
+def read_chunks(file: str, reader: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """
+    Yields the chunks of a CSV file with the same custom indices as extract_data.
+
+    Parameters:
+    file (str): The path to the CSV file.
+    reader (Iterable[DataFrame]): The chunked reader of the file.
+
+    Returns:
+    Iterator[DataFrame]: The chunks of the file.
+
+    Raises:
+    pd.errors.ParserError: If there is an error reading the file.
+    """
+    try:
+        for chunk in reader:
+            chunk.index = chunk.index + 2
+            yield chunk
+    except pd.errors.ParserError:
+        raise pd.errors.ParserError(f"There was an error reading the file {file}.")
+
+
 def extract_json_config(file: str) -> dict:
     """
     Extracts data from a JSON file.
 
+    The file is decoded with orjson when it is installed, and with the json module otherwise.
+
     Parameters:
     file (str): The path to the JSON file.
 
@@ -62,252 +227,252 @@ def extract_json_config(file: str) -> dict:
     json.JSONDecodeError: If there is an error decoding the JSON.
     """
     try:
-        with open(file, 'r') as f:
-            data = json.load(f)
+        with open(file, 'rb') as f:
+            data = json_loads(f.read())
         return data
     except FileNotFoundError:
         raise FileNotFoundError(f"The file {file} was not found.")
     except json.JSONDecodeError as e:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
         raise json.JSONDecodeError("There was an error decoding the JSON in the file.", e.doc, e.pos)
 
 
-def set_percentage_error(field: str, error: str) -> None:
+def tag_values(values: np.ndarray) -> np.ndarray:
     """
-    Sets the percentage error for a field in the problem's dictionary.
+    Classifies each value of an array by its Python type.
 
     Parameters:
-    field (str): The field name.
-    error (str): The error message.
+    values (ndarray): The values to classify.
+
+    Returns:
+    ndarray: A uint8 array with the tag of each value (1=str, 2=int, 3=float, 4=other).
     """
-    problems[field] = error
+    return np.fromiter((value_tags.get(x.__class__, other_tag) for x in values), dtype=np.uint8, count=len(values))
 
 
-def validate_unique_fields(df: pd.DataFrame, field: str) -> pd.DataFrame:
+def count_errors(mask: np.ndarray) -> Tuple[int, int]:
     """
-    Validates the uniqueness of values in a field.
+    Counts the rows flagged by a mask.
 
     Parameters:
-    df (DataFrame): The DataFrame to validate.
-    field (str): The field name to validate.
+    mask (ndarray): Boolean mask of the flagged rows.
 
     Returns:
-    DataFrame: A DataFrame containing information about repeated values.
+    tuple: The number of flagged rows and the number of rows.
     """
+    return int(np.count_nonzero(mask)), mask.size
 
-    # Get a boolean mask of duplicated values
-    duplicates_mask = df[field].duplicated(keep=False)
-    percentage: float = 0
 
-    if duplicates_mask.any():
-        # Create a DataFrame with indices of duplicated values
-        duplicated_indices = df[duplicates_mask].reset_index()
-
-        # Group by value and get a list of indices for each repeated value
-        grouped_indices = duplicated_indices.groupby(field)['index'].apply(list)
-
-        # Create a new DataFrame with necessary columns
-        new_df = grouped_indices.reset_index()
-        new_df.columns = ["Repeat_" + field, 'repeated_indexes']
-        new_df['index'] = new_df['repeated_indexes'].apply(lambda x: x.pop(0))
-
-        # Rearrange columns in specified order
-        new_df = new_df[['index', "Repeat_" + field, 'repeated_indexes']]
-
-        percentage = round(duplicates_mask.mean() * 100, 4)
-    else:
-        new_df = pd.DataFrame(columns=['index', "Repeat_" + field, 'repeated_indexes'])
-
-    set_percentage_error(field, f"Error_rate: {percentage}%")
-    return new_df
-
-
-def validate_string_fields(df: pd.DataFrame, field: str) -> pd.DataFrame:
+def error_rate(errors: int, rows: int) -> float:
     """
-    Validates if the values in a field are not strings.
+    Calculates the percentage of flagged rows.
 
     Parameters:
-    df (DataFrame): The DataFrame to validate.
-    field (str): The field name to validate.
+    errors (int): The number of flagged rows.
+    rows (int): The number of rows.
 
     Returns:
-    DataFrame: A DataFrame containing information about non-string values.
+    float: The percentage of flagged rows, rounded to 4 decimals.
     """
-    percentage: float = 0
-    non_string_mask = df[field].apply(lambda x: not isinstance(x, str) and not pd.isnull(x))
-
-    if non_string_mask.any():
+    if errors == 0:
+        return 0.0
+    return round(errors / rows * 100, 4)
 
-        # none_indices = non_string_mask[non_string_mask].index
 
-        # Create a new DataFrame
-        new_df = pd.DataFrame({
-            'index': df.index[non_string_mask],
-            f'NULL_{field}_STRING': True
-        })
+def set_flags(result: pd.DataFrame, column_name: str, mask: np.ndarray,
+              unflagged_mask: Optional[np.ndarray] = None) -> None:
+    """
+    Flags the rows of a validation in the result DataFrame.
 
-        new_df.set_index('index')
+    The flag column wraps the mask without copying it, and is left untouched (all NA) when no row is flagged.
 
-        percentage = round(non_string_mask.mean() * 100, 4)
-        set_percentage_error(field, f"Error_rate: {percentage}%")
-    else:
-        return pd.DataFrame(columns=["index", f'NULL_{field}_STRING'])
-
-    return new_df
+    Parameters:
+    result (DataFrame): The preallocated validation results, aligned with the validated DataFrame.
+    column_name (str): The name of the flag column.
+    mask (ndarray): Boolean mask of the rows to flag.
+    unflagged_mask (ndarray, optional): The inverse of mask, when it is already computed.
+    """
+    if mask.any():
+        result[column_name] = pd.arrays.BooleanArray(mask, ~mask if unflagged_mask is None else unflagged_mask)
 
 
-def validate_int_fields(df: pd.DataFrame, field: str) -> pd.DataFrame:
+def validate_unique_fields(ctx: ColumnCtx, stats: Dict[str, Tuple[int, int]], result: pd.DataFrame) -> None:
     """
-    Validates if the values in a field are integers.
+    Validates the uniqueness of values in a field.
 
     Parameters:
-    df (DataFrame): The DataFrame to validate.
-    field (str): The field name to validate.
-
-    Returns:
-    DataFrame: A DataFrame containing information about non-integer values.
+    ctx (ColumnCtx): The precomputed data of the field to validate.
+    stats (dict): The error counts per field as (errors, rows), updated in place.
+    result (DataFrame): The preallocated validation results, updated in place.
     """
-    percentage: float = 0
-    non_null_int_mask = df[field].apply(lambda x: not (isinstance(x, int) or isinstance(x, float)) and not pd.isnull(x))
 
-    if non_null_int_mask.any():
+    # Factorize once, slot 0 of the counts holds the null values
+    codes, uniques = pd.factorize(ctx.column)
+    counts = np.bincount(codes + 1, minlength=len(uniques) + 1)
+    duplicates_mask = counts[codes + 1] > 1
 
-        # none_indices = non_string_mask[non_string_mask].index.tolist()
+    if duplicates_mask.any():
+        # Sort the rows by code so every value is a contiguous run, the null values (-1) come first
+        order = np.argsort(codes, kind='stable')
+        sorted_labels = ctx.index.values[order]
+        boundaries = np.concatenate(([0], np.cumsum(counts)))
 
-        # Create a new DataFrame
+        # The first occurrence is the reported row, the rest are its repeated indexes
+        dup_codes = np.flatnonzero(counts[1:] > 1)
+        starts = boundaries[dup_codes + 1]
+        ends = boundaries[dup_codes + 2]
+        heads = pd.Index(sorted_labels[starts])
+        result[repeat_column.format(ctx.field)] = pd.Series(np.asarray(uniques)[dup_codes], index=heads)
+        result[repeat_indexes_column.format(ctx.field)] = pd.Series(
+            [sorted_labels[start + 1:end].tolist() for start, end in zip(starts, ends)], index=heads)
 
-        new_df = pd.DataFrame({
-            'index': df.index[non_null_int_mask],
-            f'NULL_{field}_INT': True
-        })
+    stats[ctx.field] = count_errors(duplicates_mask)
 
-        new_df.set_index('index')
 
-        percentage = round(non_null_int_mask.mean() * 100, 4)
-        set_percentage_error(field, f"Error_rate: {percentage}%")
+def validate_string_fields(ctx: ColumnCtx, stats: Dict[str, Tuple[int, int]], result: pd.DataFrame) -> None:
+    """
+    Validates if the values in a field are not strings.
+
+    Parameters:
+    ctx (ColumnCtx): The precomputed data of the field to validate.
+    stats (dict): The error counts per field as (errors, rows), updated in place.
+    result (DataFrame): The preallocated validation results, updated in place.
+    """
+    column = ctx.column
+
+    if pd.api.types.infer_dtype(column, skipna=True) in ("string", "empty"):
+        # Uniform string column, nothing to check per value
+        non_string_mask = np.zeros(len(column), dtype=bool)
     else:
-        return pd.DataFrame(columns=["index", f'NULL_{field}_INT'])
+        # One pass to tag the values, the comparison itself runs in NumPy
+        tags = tag_values(column.to_numpy(dtype=object))
+        non_string_mask = (tags != string_tag) & ctx.notnull_mask
 
-    return new_df
+    set_flags(result, string_column.format(ctx.field), non_string_mask)
 
+    if non_string_mask.any():
+        stats[ctx.field] = count_errors(non_string_mask)
 
-def validate_none_fields(df: pd.DataFrame, field: str) -> pd.DataFrame:
+
+def validate_int_fields(ctx: ColumnCtx, stats: Dict[str, Tuple[int, int]], result: pd.DataFrame) -> None:
     """
-    Validates if the values in a field are None.
+    Validates if the values in a field are integers.
 
     Parameters:
-    df (DataFrame): The DataFrame to validate.
-    field (str): The field name to validate.
-
-    Returns:
-    DataFrame: A DataFrame containing information about None values.
+    ctx (ColumnCtx): The precomputed data of the field to validate.
+    stats (dict): The error counts per field as (errors, rows), updated in place.
+    result (DataFrame): The preallocated validation results, updated in place.
     """
-    percentage: float = 0
-    none_mask = df[field].isnull()
+    non_null_int_mask = pd.to_numeric(ctx.column, errors='coerce').isna().to_numpy() & ctx.notnull_mask
 
-    if none_mask.any():
+    set_flags(result, int_column.format(ctx.field), non_null_int_mask)
 
-        new_df = pd.DataFrame({
-            'index': df.index[none_mask],
-            f'NONE_{field}_VALUE': True
-        })
+    if non_null_int_mask.any():
+        stats[ctx.field] = count_errors(non_null_int_mask)
 
-        new_df = new_df.set_index('index')
 
-        percentage = round(none_mask.mean() * 100, 4)
-    else:
-        new_df = pd.DataFrame(columns=["index", f'NONE_{field}_VALUE'])
+def validate_none_fields(ctx: ColumnCtx, stats: Dict[str, Tuple[int, int]], result: pd.DataFrame) -> None:
+    """
+    Validates if the values in a field are None.
 
-    set_percentage_error(field, f"Error_rate: {percentage}%")
+    Parameters:
+    ctx (ColumnCtx): The precomputed data of the field to validate.
+    stats (dict): The error counts per field as (errors, rows), updated in place.
+    result (DataFrame): The preallocated validation results, updated in place.
+    """
+    # The null masks of the context are the flag values and their NA mask as is
+    set_flags(result, none_column.format(ctx.field), ctx.null_mask, ctx.notnull_mask)
 
-    return new_df
+    stats[ctx.field] = count_errors(ctx.null_mask)
 
 
-def validate_date_format(df: pd.DataFrame, field: str) -> pd.DataFrame:
+def validate_date_format(ctx: ColumnCtx, stats: Dict[str, Tuple[int, int]], result: pd.DataFrame) -> None:
     """
     Validates if the values in a date field have a specific format.
 
     Parameters:
-    df (DataFrame): The DataFrame to validate.
-    field (str): The field name to validate.
-
-    Returns:
-    DataFrame: A DataFrame containing information about invalid date formats.
+    ctx (ColumnCtx): The precomputed data of the field to validate.
+    stats (dict): The error counts per field as (errors, rows), updated in place.
+    result (DataFrame): The preallocated validation results, updated in place.
     """
-    formato_deseado: str = '%Y-%m-%d %H:%M:%S'
-    percentage: float = 0
-
-    invalid_format_mask = pd.to_datetime(df[field], format=formato_deseado, errors='coerce').isna()
-
-    if invalid_format_mask.any():
-        # invalid_indices = invalid_format_mask[invalid_format_mask].index
-
-        # Create a new DataFrame
-        new_df = pd.DataFrame({
-            'index': df.index[invalid_format_mask],
-            f'INVALID_{field}_FORMAT': True
-        })
-
-        new_df = new_df.set_index('index')
+    column = ctx.column
 
+    if pd.api.types.is_datetime64_any_dtype(column):
+        # Already parsed with the expected format by extract_data
+        invalid_format_mask = np.zeros(len(column), dtype=bool)
     else:
-        return pd.DataFrame(columns=["index", f'INVALID_{field}_FORMAT'])
+        # Null values are reported by validate_none_fields, not as an invalid format
+        parsed = pd.to_datetime(column, format=date_format, errors='coerce', cache=True)
+        invalid_format_mask = parsed.isna().to_numpy() & ctx.notnull_mask
 
-    return new_df
+    set_flags(result, date_column.format(ctx.field), invalid_format_mask)
 
 
-def validate_country_codes(df: pd.DataFrame, field: str) -> pd.DataFrame:
+def validate_country_codes(ctx: ColumnCtx, stats: Dict[str, Tuple[int, int]], result: pd.DataFrame) -> None:
     """
     Validates if the values in a field are present in the provided list of country codes.
 
     Parameters:
-    df (DataFrame): The DataFrame to validate.
-    field (str): The field name to validate.
-
-
-    Returns:
-    DataFrame: A DataFrame containing information about non-matching values.
+    ctx (ColumnCtx): The precomputed data of the field to validate.
+    stats (dict): The error counts per field as (errors, rows), updated in place.
+    result (DataFrame): The preallocated validation results, updated in place.
     """
-    country_list = ["AR", "BR", "CL", "CO", "CR", "CU", "DO", "EC", "SV", "GT", "HT", "HN", "JM", "MX", "NI", "PA",
-                    "PY", "PE", "PR", "UY", "VE"]
-
-    non_matching_values = df.loc[~df[field].isin(country_list) & df[field].notnull()]
+    non_matching_mask = ctx.notnull_mask & ~ctx.column.isin(country_codes).to_numpy()
+    set_flags(result, country_code_column.format(ctx.field), non_matching_mask)
 
-    if not non_matching_values.empty:
-        new_df = pd.DataFrame({
-            'index': df.index[non_matching_values],
-            f'NOT_IN_{field}_LIST': True
-        })
-
-        percentage = len(non_matching_values) / len(df) * 100
-        set_percentage_error(field, f"Error_rate: {percentage}%")
-
-        return new_df
-    else:
-        return pd.DataFrame(columns=["index", f'NOT_IN_{field}_LIST'])
+    if non_matching_mask.any():
+        stats[ctx.field] = count_errors(non_matching_mask)
 
 
-def calculate_percentage_error(original: pd.DataFrame, merge: pd.DataFrame) -> str:
+def calculate_percentage_error(original_rows: int, rejected_rows: int) -> str:
     """
-    Calculates the percentage error between two DataFrames.
+    Calculates the percentage of valid rows of a file.
 
     Parameters:
-    original (DataFrame): The original DataFrame.
-    merge (DataFrame): The merged DataFrame.
+    original_rows (int): The number of rows of the file.
+    rejected_rows (int): The number of rejected rows.
 
     Returns:
-    str: The percentage error as a string.
+    str: The percentage as a string.
     """
-    len_ori = len(original)
-    len_merge = len(merge)
-    if len_ori == len_merge:
+    if original_rows == rejected_rows:
         return "0%"
-    elif len_ori == 0:
+    elif original_rows == 0:
         return "0%"
     else:
-        return f'{round(((len_ori - len_merge) / len_ori) * 100, 4)}%'
+        return f'{round(((original_rows - rejected_rows) / original_rows) * 100, 4)}%'
 
 
-def validate_field_dic(df: pd.DataFrame, field: str, validations: dict) -> list:
+def select_validators(validations: dict) -> List[Tuple[Callable, Tuple[str, ...]]]:
+    """
+    Selects the validators to run for a field based on rules in a dictionary.
+
+    Parameters:
+    validations (dict): Validation rules.
+
+    Returns:
+    list: The validators to run, each with the templates of the result columns it writes.
+    """
+    selected = []
+    if none in validations and validations[none]:
+        selected.append((validate_none_fields, (none_column,)))
+    if unique in validations and validations[unique]:
+        selected.append((validate_unique_fields, (repeat_column, repeat_indexes_column)))
+    if type in validations:
+        if validations[type] == int_type:
+            selected.append((validate_int_fields, (int_column,)))
+        if validations[type] == string_type:
+            selected.append((validate_string_fields, (string_column,)))
+        if validations[type] == date_type:
+            selected.append((validate_date_format, (date_column,)))
+        if validations[type] == country_code_type:
+            selected.append((validate_country_codes, (country_code_column,)))
+    return selected
+
+
+def validate_field_dic(df: pd.DataFrame, field: str, validations: dict, stats: Dict[str, Tuple[int, int]],
+                       result: pd.DataFrame, repeated: Optional[pd.DataFrame] = None,
+                       check_errors: Optional[Dict[Tuple[str, str], int]] = None) -> None:
     """
     Validates a DataFrame field based on rules in a dictionary.
 
@@ -315,62 +480,122 @@ def validate_field_dic(df: pd.DataFrame, field: str, validations: dict) -> list:
     df (pandas.DataFrame): DataFrame to validate.
     field (str): Field to validate.
     validations (dict): Validation rules.
-
-    Returns:
-    list: List of DataFrames with validation results.
+    stats (dict): The error counts per field as (errors, rows), updated in place.
+    result (DataFrame): The preallocated validation results, updated in place.
+    repeated (DataFrame, optional): Results of the unique validations over the whole file, used instead of
+                                    validating the uniqueness on df when it is a chunk of the file.
+    check_errors (dict, optional): The errors per (field, validator name) of the validators that reported their
+                                   counts, summed in place across chunks.
 
     Raises:
     ColumnNotFoundError: If the DataFrame does not have the expected columns.
 
     """
-    list_df = []
     try:
-        if none in validations and validations[none]:
-            list_df.append(validate_none_fields(df, field))
-        if unique in validations and validations[unique]:
-            list_df.append(validate_unique_fields(df, field))
-        if type in validations:
-            if validations[type] == int_type:
-                list_df.append(validate_int_fields(df, field))
-            if validations[type] == string_type:
-                list_df.append(validate_string_fields(df, field))
-            if validations[type] == date_type:
-                list_df.append(validate_date_format(df, field))
-            if validations[type] == country_code_type:
-                list_df.append(validate_country_codes(df, field))
+        ctx = ColumnCtx.from_dataframe(df, field)
     except KeyError:
         raise ColumnNotFoundError(f"The DataFrame does not have the expected column: {field}")
-    return list_df
-
 
-def validate_fields_from_json(df: pd.DataFrame, data_config: dict) -> pd.DataFrame:
+    for validator, templates in select_validators(validations):
+        if validator is validate_unique_fields and repeated is not None:
+            # Uniqueness was checked over the whole file, copy the rows of this chunk
+            for template in templates:
+                result[template.format(field)] = repeated[template.format(field)].reindex(result.index)
+        else:
+            reported: Dict[str, Tuple[int, int]] = {}
+            validator(ctx, reported, result)
+            stats.update(reported)
+            if check_errors is not None and field in reported:
+                key = (field, validator.__name__)
+                check_errors[key] = check_errors.get(key, 0) + reported[field][0]
+
+
+def validate_fields_from_json(df: pd.DataFrame, data_config: dict, stats: Dict[str, Tuple[int, int]],
+                              repeated: Optional[pd.DataFrame] = None,
+                              check_errors: Optional[Dict[Tuple[str, str], int]] = None) -> pd.DataFrame:
     """
     Validates the fields of a DataFrame based on the rules specified in a JSON configuration.
 
+    The result columns only depend on the configuration, so they are allocated once before running the validators,
+    which then flag the rows in place.
+
     Parameters:
     df (pandas.DataFrame): The DataFrame to validate.
     data_config (dict): The JSON configuration containing the validation rules.
                         The keys are the field names and the values are dictionaries specifying the validations for
                         each field.
+    stats (dict): The error counts per field as (errors, rows), updated in place.
+    repeated (DataFrame, optional): Results of the unique validations over the whole file, when df is a chunk.
+    check_errors (dict, optional): The errors per (field, validator name), summed in place across chunks.
 
     Returns:
     pandas.DataFrame: A DataFrame containing the validation results. Each row corresponds to a validation error,
                       and the columns correspond to the fields of the original DataFrame.
     """
-    list_df = []
-    # Iterate over each field in the dictionary and perform the corresponding validations
+    size = len(df)
+    columns = {}
     for field, validations in data_config["data_valid"].items():
-        list_df.extend(validate_field_dic(df, field, validations))
+        for _, templates in select_validators(validations):
+            for template in templates:
+                if template in value_columns:
+                    columns[template.format(field)] = np.full(size, None, dtype=object)
+                else:
+                    columns[template.format(field)] = pd.arrays.BooleanArray(np.zeros(size, dtype=bool),
+                                                                             np.ones(size, dtype=bool))
 
-    if list_df:
-        merged_df = reduce(lambda left, right: pd.merge(left, right, on=['index'], how='outer'), list_df)
-    else:
-        merged_df = pd.DataFrame()
+    if not columns:
+        return pd.DataFrame()
+
+    result = pd.DataFrame(columns, index=df.index)
 
-    merged_df.columns = merged_df.columns.str.upper()
+    # Iterate over each field in the dictionary and perform the corresponding validations
+    for field, validations in data_config["data_valid"].items():
+        validate_field_dic(df, field, validations, stats, result, repeated, check_errors)
+
+    # Keep the rows flagged by at least one validation
+    merged_df = result[result.notna().any(axis=1).to_numpy()].rename_axis(index_column).reset_index()
+    merged_df.columns = [name.upper() for name in merged_df.columns]
     return merged_df
 
 
+def validate_unique_over_file(file: str, delimiter: str, data_config: dict,
+                              stats: Dict[str, Tuple[int, int]]) -> pd.DataFrame:
+    """
+    Validates the uniqueness of the configured fields over a whole file that is validated in chunks.
+
+    Only the fields with the unique validation are read, so the memory used is that of those columns.
+
+    Parameters:
+    file (str): The path to the CSV file.
+    delimiter (str): The delimiter used in the CSV file.
+    data_config (dict): The JSON configuration containing the validation rules.
+    stats (dict): The error counts per field as (errors, rows), updated in place.
+
+    Returns:
+    DataFrame: The repeated values and indexes, indexed by the first row of each repeated value.
+
+    Raises:
+    ColumnNotFoundError: If the file does not have the expected columns.
+    """
+    fields = [field for field, validations in data_config["data_valid"].items() if validations.get(unique)]
+    if not fields:
+        return pd.DataFrame()
+
+    try:
+        df = pd.read_csv(file, delimiter=delimiter, usecols=fields)
+    except ValueError:
+        raise ColumnNotFoundError(f"The DataFrame does not have the expected columns: {fields}")
+    df.index = df.index + 2
+
+    repeated = pd.DataFrame(index=df.index)
+    for field in fields:
+        validate_unique_fields(ColumnCtx.from_dataframe(df, field), stats, repeated)
+        for template in (repeat_column, repeat_indexes_column):
+            if template.format(field) not in repeated:
+                repeated[template.format(field)] = None
+    return repeated.dropna(how='all')
+
+
 def verify_columns(df, expected_columns):
     """
     Verifies that the columns of a DataFrame include a list of expected columns.
@@ -389,15 +614,125 @@ def verify_columns(df, expected_columns):
             f"The DataFrame does not have all the expected columns. Missing columns: {missing_columns}")
 
 
-def save_rejected_data(data: pd.DataFrame, rejected_file: str) -> None:
+def format_rejected_data(data: pd.DataFrame) -> pd.DataFrame:
     """
-    Saves rejected data to a CSV file.
+    Converts the flags and the repeated values and indexes of the rejected data to text.
+
+    Flags are written as "True" and unflagged cells as empty text, so the file is the same with or without pyarrow.
 
     Parameters:
     data (DataFrame): The rejected data.
+
+    Returns:
+    DataFrame: The rejected data with every column but the index as text.
+    """
+    columns = {}
+    for column, dtype in data.dtypes.items():
+        if column == index_column:
+            continue
+        if isinstance(dtype, pd.BooleanDtype):
+            columns[column] = np.where(data[column].to_numpy(dtype=bool, na_value=False), 'True', '')
+        else:
+            columns[column] = data[column].map(str, na_action='ignore').fillna('')
+    return data.assign(**columns)
+
+
+def save_rejected_data(data: Union[pd.DataFrame, Iterable[pd.DataFrame]], rejected_file: str) -> None:
+    """
+    Saves rejected data to a CSV file.
+
+    The PyArrow CSV writer is used when pyarrow is installed, and DataFrame.to_csv otherwise, both quoting every
+    field but the index. The data can be given in chunks, which are appended to the file as they come.
+
+    Parameters:
+    data (DataFrame or Iterable[DataFrame]): The rejected data, or its chunks.
     rejected_file (str): The path to the CSV file to save the rejected data.
     """
-    data.to_csv(rejected_file, index=False)
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+
+    if pv is None:
+        header = True
+        for chunk in chunks:
+            format_rejected_data(chunk).to_csv(rejected_file, index=False, mode='w' if header else 'a', header=header,
+                                               quoting=csv.QUOTE_NONNUMERIC, lineterminator='\n')
+            header = False
+        return
+
+    schema = None
+    writer = None
+    try:
+        for chunk in chunks:
+            chunk = format_rejected_data(chunk)
+            if schema is None:
+                # Every chunk has the same columns, fix their types so all-empty columns match as well
+                schema = pa.schema([
+                    (column, pa.int64() if column == index_column else pa.string()) for column in chunk.columns
+                ])
+                writer = pv.CSVWriter(rejected_file, schema, write_options=pv.WriteOptions(batch_size=65536))
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def process_file(file: str, data_config: dict) -> Dict[str, Tuple[int, int]]:
+    """
+    Validates a CSV file and saves its rejected records next to it.
+
+    Files larger than large_file_size are validated and saved chunk by chunk. The uniqueness of their fields is
+    validated beforehand over the whole file.
+
+    Parameters:
+    file (str): The path to the CSV file.
+    data_config (dict): The JSON configuration containing the validation rules.
+
+    Returns:
+    dict: The error counts per field as (errors, rows).
+    """
+    delimiter = data_config.get("delimiter")
+    rejected_file = file.replace('.csv', '') + "_rejected_records.csv"
+
+    print(f'Extracting data from {file}...')
+    data = extract_data(file, delimiter, data_config)
+    stats: Dict[str, Tuple[int, int]] = {}
+
+    if isinstance(data, pd.DataFrame):
+        print(f"Validating fields of {file}...")
+        data_out = validate_fields_from_json(data, data_config, stats)
+
+        print(f'percentage of life of the file {calculate_percentage_error(len(data), len(data_out))}')
+        print(f"Saving rejected records to '{rejected_file}':")
+        save_rejected_data(data_out, rejected_file)
+        return stats
+
+    print(f"Validating fields of {file} in chunks of {chunk_size} rows...")
+    unique_stats: Dict[str, Tuple[int, int]] = {}
+    repeated = validate_unique_over_file(file, delimiter, data_config, unique_stats)
+    total_rows = 0
+    rejected_rows = 0
+    check_errors: Dict[Tuple[str, str], int] = {}
+
+    def validate_chunks() -> Iterator[pd.DataFrame]:
+        nonlocal total_rows, rejected_rows
+        for chunk in data:
+            chunk_out = validate_fields_from_json(chunk, data_config, {}, repeated, check_errors)
+            total_rows += len(chunk)
+            rejected_rows += len(chunk_out)
+            yield chunk_out
+
+    print(f"Saving rejected records to '{rejected_file}':")
+    save_rejected_data(validate_chunks(), rejected_file)
+
+    # Same order as validate_field_dic, so the last validator that reported a field over the whole file wins
+    for field, validations in data_config["data_valid"].items():
+        for validator, _ in select_validators(validations):
+            if validator is validate_unique_fields:
+                stats[field] = unique_stats[field]
+            elif (field, validator.__name__) in check_errors:
+                stats[field] = (check_errors[(field, validator.__name__)], total_rows)
+
+    print(f'percentage of life of the file {calculate_percentage_error(total_rows, rejected_rows)}')
+    return stats
 
 
 def main():
@@ -412,21 +747,32 @@ def main():
 
         print(f'Extracting configuration from {route_json_conf}...')
         dic = extract_json_config(route_json_conf)
-        file = dic.get("route_file")
-
-        delimiter = dic.get("delimiter")
-        rejected_file = file.replace('.csv', '') + "_rejected_records.csv"
-
-        print(f'Extracting data from {file}...')
-        df = extract_data(file, delimiter)
-
-        print("Validating fields...")
-
-        data_out = validate_fields_from_json(df, dic)
-
-        print(f'percentage of life of the file {calculate_percentage_error(df, data_out)}')
-        print(f"Saving rejected records to '{rejected_file}':")
-        save_rejected_data(data_out, rejected_file)
+        files = dic.get("route_file")
+        if isinstance(files, str):
+            files = [files]
+
+        results: Dict[str, Union[Dict[str, Tuple[int, int]], Exception]] = {}
+        if len(files) == 1:
+            results[files[0]] = process_file(files[0], dic)
+        else:
+            # Every file has its own stats, so they can be processed in parallel. A failing file is reported with
+            # the others instead of stopping them.
+            with ProcessPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as executor:
+                futures = {file: executor.submit(process_file, file, dic) for file in files}
+                for file, future in futures.items():
+                    try:
+                        results[file] = future.result()
+                    except (pd.errors.ParserError, ValueError, FileNotFoundError, ColumnNotFoundError,
+                            KeyError) as e:
+                        results[file] = e
+
+        for file, stats in results.items():
+            if isinstance(stats, Exception):
+                print(f'Failed to process {file}: {stats.__class__.__name__}: {stats}')
+                continue
+            print(f'Error rates of {file}:')
+            for field, counts in stats.items():
+                print(f'  {field}: Error_rate: {error_rate(*counts)}%')
 
         print("Process completed.")
 
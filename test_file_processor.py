@@ -0,0 +1,114 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import file_processor
+
+rows = """ID,NOMBRE,FECHA,PAIS
+1,ana,2020-01-01 10:00:00,AR
+2,5,2020-01-01,ZZ
+2,bob,,MX
+x,,2020-02-02 11:11:11,
+4,carl,2020-01-01 10:00:00,BR
+4,dan,bad,AR
+"""
+
+
+class ProcessFileTest(unittest.TestCase):
+    """The in-memory and chunked paths and both CSV writers must give the expected stats and rejected file."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.tmp.name, "data.csv")
+        self.write(rows)
+
+    def write(self, text):
+        with open(self.file, "w") as f:
+            f.write(text)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def process(self, data_valid, chunked, arrow=True):
+        data_config = {"delimiter": ",", "data_valid": data_valid}
+        with mock.patch.object(file_processor, "large_file_size", -1 if chunked else 1024 ** 3), \
+                mock.patch.object(file_processor, "chunk_size", 2), \
+                mock.patch.object(file_processor, "pv", file_processor.pv if arrow else None):
+            stats = file_processor.process_file(self.file, data_config)
+        with open(os.path.join(self.tmp.name, "data_rejected_records.csv")) as f:
+            return stats, f.read()
+
+    def check(self, data_valid, expected_stats, expected_rows):
+        expected = (expected_stats, "\n".join(expected_rows) + "\n")
+        self.assertEqual(self.process(data_valid, chunked=False), expected)
+        self.assertEqual(self.process(data_valid, chunked=True), expected)
+
+    def test_unique_before_type(self):
+        # The repeated IDs 2 and 4 cross the boundaries of the chunks of 2 rows
+        self.check({
+            "ID": {"none": True, "unique": True, "type": "int"},
+            "NOMBRE": {"none": True, "unique": True, "type": "string"},
+            "FECHA": {"none": True, "type": "date"},
+            "PAIS": {"none": True, "type": "country_code"},
+        }, {"ID": (1, 6), "NOMBRE": (0, 6), "FECHA": (1, 6), "PAIS": (1, 6)}, [
+            '"INDEX","NONE_ID_VALUE","REPEAT_ID","REPEAT_ID_INDEXES","NULL_ID_INT","NONE_NOMBRE_VALUE",'
+            '"REPEAT_NOMBRE","REPEAT_NOMBRE_INDEXES","NULL_NOMBRE_STRING","NONE_FECHA_VALUE","INVALID_FECHA_FORMAT",'
+            '"NONE_PAIS_VALUE","NOT_IN_PAIS_LIST"',
+            '3,"","2","[4]","","","","","","","True","","True"',
+            '4,"","","","","","","","","True","","",""',
+            '5,"","","","True","True","","","","","","True",""',
+            '6,"","4","[7]","","","","","","","","",""',
+            '7,"","","","","","","","","","True","",""',
+        ])
+
+    def test_unique_after_type(self):
+        self.check({
+            "ID": {"none": True, "type": "int", "unique": True},
+            "NOMBRE": {"none": True, "type": "string", "unique": True},
+            "PAIS": {"none": True, "type": "country_code", "unique": True},
+        }, {"ID": (1, 6), "NOMBRE": (0, 6), "PAIS": (1, 6)}, [
+            '"INDEX","NONE_ID_VALUE","REPEAT_ID","REPEAT_ID_INDEXES","NULL_ID_INT","NONE_NOMBRE_VALUE",'
+            '"REPEAT_NOMBRE","REPEAT_NOMBRE_INDEXES","NULL_NOMBRE_STRING","NONE_PAIS_VALUE","REPEAT_PAIS",'
+            '"REPEAT_PAIS_INDEXES","NOT_IN_PAIS_LIST"',
+            '2,"","","","","","","","","","AR","[7]",""',
+            '3,"","2","[4]","","","","","","","","","True"',
+            '5,"","","","True","True","","","","True","","",""',
+            '6,"","4","[7]","","","","","","","","",""',
+        ])
+
+    def test_string_field_with_a_numeric_chunk(self):
+        self.write("ID,NOMBRE\n1,ana\n2,bob\n3,5\n4,\n5,6\n")
+        self.check({"NOMBRE": {"none": True, "type": "string"}}, {"NOMBRE": (1, 5)}, [
+            '"INDEX","NONE_NOMBRE_VALUE","NULL_NOMBRE_STRING"',
+            '5,"True",""',
+        ])
+
+    def test_country_code_not_in_list(self):
+        self.write("ID,PAIS\n1,AR\n2,ZZ\n3,MX\n4,\n")
+        self.check({"PAIS": {"type": "country_code"}}, {"PAIS": (1, 4)}, [
+            '"INDEX","NOT_IN_PAIS_LIST"',
+            '3,"True"',
+        ])
+
+    def test_date_format(self):
+        # The empty date is left to the none check, only the date without time has the wrong format
+        self.write("ID,FECHA\n1,2020-01-01 10:00:00\n2,\n3,2020-01-01\n")
+        self.check({"FECHA": {"none": True, "type": "date"}}, {"FECHA": (1, 3)}, [
+            '"INDEX","NONE_FECHA_VALUE","INVALID_FECHA_FORMAT"',
+            '3,"True",""',
+            '4,"","True"',
+        ])
+
+    @unittest.skipIf(file_processor.pv is None, "pyarrow is not installed")
+    def test_same_rejected_file_without_pyarrow(self):
+        data_valid = {
+            "ID": {"none": True, "unique": True, "type": "int"},
+            "NOMBRE": {"none": True, "type": "string"},
+        }
+        for chunked in (False, True):
+            self.assertEqual(self.process(data_valid, chunked), self.process(data_valid, chunked, arrow=False))
+
+
+if __name__ == "__main__":
+    unittest.main()